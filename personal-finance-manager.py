@@ -1,12 +1,87 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import bisect
 import csv
 import datetime
+import mmap
+import os
+from array import array
+from collections import OrderedDict
+import numpy as np
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
 from ttkthemes import ThemedTk
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Stable small-int codes for category strings, grown on demand; filters
+# translate a category name once and compare ints per row.
+_category_codes = {}
+
+def _parse_iso_date(s):
+    y, m, d = s.split('-')
+    return datetime.date(int(y), int(m), int(d))
+
+def _summary_kernel(amounts, type_code, mode_code):
+    tc = td = oc = od = cc = cd = 0.0
+    for i in range(amounts.shape[0]):
+        amount = amounts[i]
+        if type_code[i] == 1:
+            tc += amount
+            if mode_code[i] == 0:
+                oc += amount
+            else:
+                cc += amount
+        else:
+            td += amount
+            if mode_code[i] == 0:
+                od += amount
+            else:
+                cd += amount
+    return tc, td, oc, od, cc, cd
+
+def _filter_kernel(dates, use_dates, d_lo, d_hi, type_code, t_code, mode_code, m_code, cat_codes, c_code):
+    # Sentinels for "facet not pinned": t_code=0, m_code=-1, c_code=-2.
+    n = type_code.shape[0]
+    out = np.empty(n, np.bool_)
+    for i in prange(n):
+        ok = True
+        if use_dates:
+            d = dates[i]
+            if d < d_lo or d > d_hi:
+                ok = False
+        if t_code != 0 and type_code[i] != t_code:
+            ok = False
+        if m_code != -1 and mode_code[i] != m_code:
+            ok = False
+        if c_code != -2 and cat_codes[i] != c_code:
+            ok = False
+        out[i] = ok
+    return out
+
+if njit is not None:
+    _summary_kernel = njit(cache=True, fastmath=True)(_summary_kernel)
+    _filter_kernel = njit(cache=True, parallel=True)(_filter_kernel)
+
+_EMPTY_I8 = np.empty(0, dtype=np.int64)
+
 class Transaction:
+    __slots__ = ('date', 'transaction_type', 'category', 'reason', 'amount', 'notes', 'mode',
+                 '_signed', '_mode_is_online', '_date', '_search_blob', '_amount_str',
+                 'type_code', 'mode_code', 'category_code')
+
     def __init__(self, date, transaction_type, category, reason, amount, notes="", mode="Online"):
         self.date = date
         self.transaction_type = transaction_type
@@ -15,52 +90,179 @@ class Transaction:
         self.amount = amount
         self.notes = notes
         self.mode = mode
+        self._signed = amount if transaction_type == "Credit" else -amount
+        self._mode_is_online = mode == "Online"
+        try:
+            self._date = _parse_iso_date(date)
+        except ValueError:
+            self._date = None
+        self._search_blob = (reason + '\x1f' + notes + '\x1f' + category).lower()
+        self._amount_str = f"₹{amount:.2f}"
+        self.type_code = 1 if transaction_type == "Credit" else -1
+        self.mode_code = 0 if mode == "Online" else 1
+        self.category_code = _category_codes.setdefault(category, len(_category_codes))
 
     def __str__(self):
+        # Debugging aid only; CSV emission goes through attribute tuples.
         return f"{self.date},{self.transaction_type},{self.category},{self.reason},{self.amount},{self.notes},{self.mode}"
 
 def save_transactions_to_csv(transactions, filename="transactions.csv"):
     try:
-        with open(filename, 'w', newline='') as csvfile:
+        with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
             csv_writer = csv.writer(csvfile)
-            csv_writer.writerow(['Date', 'Type', 'Category', 'Reason', 'Amount', 'Notes', 'Mode'])
-            for transaction in transactions:
-                csv_writer.writerow([transaction.date, transaction.transaction_type, transaction.category, transaction.reason, transaction.amount, transaction.notes, transaction.mode])
+            csv_writer.writerow(('Date', 'Type', 'Category', 'Reason', 'Amount', 'Notes', 'Mode'))
+            csv_writer.writerows((t.date, t.transaction_type, t.category, t.reason, t.amount, t.notes, t.mode) for t in transactions)
     except Exception as e:
         messagebox.showerror("Error", f"Error saving transactions: {e}")
+        return False
+    return True
+
+def _append_transaction_to_csv(transaction, filename="transactions.csv"):
+    try:
+        with open(filename, 'a', newline='') as csvfile:
+            csv.writer(csvfile).writerow((transaction.date, transaction.transaction_type, transaction.category,
+                                          transaction.reason, transaction.amount, transaction.notes, transaction.mode))
+    except Exception as e:
+        messagebox.showerror("Error", f"Error saving transactions: {e}")
+
+def _save_transactions_parquet(transactions, filename="transactions.parquet"):
+    table = pa.table({
+        'date': pa.array([t.date for t in transactions], pa.string()),
+        'type': pa.array([t.transaction_type for t in transactions], pa.string()).dictionary_encode(),
+        'category': pa.array([t.category for t in transactions], pa.string()).dictionary_encode(),
+        'reason': pa.array([t.reason for t in transactions], pa.string()),
+        'amount': pa.array([t.amount for t in transactions], pa.float64()),
+        'notes': pa.array([t.notes for t in transactions], pa.string()),
+        'mode': pa.array([t.mode for t in transactions], pa.string()).dictionary_encode(),
+    })
+    pq.write_table(table, filename)
+
+def _load_transactions_parquet(filename="transactions.parquet"):
+    table = pq.read_table(filename)
+    columns = [table.column(name).to_pylist() for name in ('date', 'type', 'category', 'reason', 'amount', 'notes', 'mode')]
+    return list(map(Transaction, *columns))
+
+def save_transactions(transactions):
+    if pa is not None:
+        try:
+            _save_transactions_parquet(transactions)
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Error saving transactions: {e}. Falling back to CSV.")
+    # The CSV is now the authoritative copy; drop any parquet file so a stale
+    # one cannot shadow it on the next launch. Only once the CSV actually
+    # wrote, so a double failure never destroys the last good snapshot.
+    if save_transactions_to_csv(transactions) and os.path.exists("transactions.parquet"):
+        try:
+            os.remove("transactions.parquet")
+        except OSError:
+            pass
+
+def load_transactions():
+    if pa is not None and os.path.exists("transactions.parquet"):
+        try:
+            return _load_transactions_parquet()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error loading transactions: {e}. Falling back to CSV.")
+    return load_transactions_from_csv()
+
+def _show_load_errors(errors):
+    if errors:
+        shown = "\n".join(errors[:10])
+        if len(errors) > 10:
+            shown += f"\n... and {len(errors) - 10} more."
+        messagebox.showerror("Error", f"Problems while loading transactions:\n{shown}")
+
+def _load_transactions_mmap(filename):
+    with open(filename, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+        with mm:
+            if mm.find(b'"') != -1:
+                return None
+            header_end = mm.find(b'\n')
+            if header_end == -1:
+                return None
+            if bytes(mm[:header_end]).rstrip(b'\r') != b'Date,Type,Category,Reason,Amount,Notes,Mode':
+                return None
+            errors = []
+            dates, types, categories, reasons, notes, modes = [], [], [], [], [], []
+            amounts = array('d')
+            for line in bytes(mm[header_end + 1:]).split(b'\n'):
+                line = line.rstrip(b'\r')
+                if not line:
+                    continue
+                fields = line.split(b',')
+                if len(fields) != 7:
+                    return None
+                try:
+                    amount = float(fields[4])
+                    date, transaction_type, category = fields[0].decode(), fields[1].decode(), fields[2].decode()
+                    reason, note, mode = fields[3].decode(), fields[5].decode(), fields[6].decode()
+                except (ValueError, UnicodeDecodeError) as e:
+                    errors.append(f"CSV data error at row: {line!r}. Error: {e}")
+                    continue
+                amounts.append(amount)
+                dates.append(date)
+                types.append(transaction_type)
+                categories.append(category)
+                reasons.append(reason)
+                notes.append(note)
+                modes.append(mode)
+            transactions = list(map(Transaction, dates, types, categories, reasons, amounts, notes, modes))
+            return transactions, errors
 
 def load_transactions_from_csv(filename="transactions.csv"):
     transactions = []
     try:
+        fast_result = _load_transactions_mmap(filename)
+        if fast_result is not None:
+            transactions, errors = fast_result
+            _show_load_errors(errors)
+            return transactions
         with open(filename, 'r') as csvfile:
             csv_reader = csv.reader(csvfile)
             header = next(csv_reader, None)
             expected_header = ['Date', 'Type', 'Category', 'Reason', 'Amount', 'Notes', 'Mode']
             if header != expected_header and header is not None:
                 messagebox.showwarning("Warning", f"CSV header mismatch. Expected: {expected_header}, Found: {header}")
+            errors = []
+            append = transactions.append
             for row in csv_reader:
-                if row:
+                if not row:
+                    continue
+                if len(row) == 7:
+                    date, transaction_type, category, reason, amount, notes, mode = row
                     try:
-                        date, transaction_type, category, reason, amount, *parts = row
-                        notes_parts = []
-                        mode = "Online"
-                        if len(parts) > 1:
-                            mode = parts[-1]
-                            notes_parts = parts[:-1]
-                        elif len(parts) == 1:
-                            if parts[0] in ['Online', 'Cash']:
-                                mode = parts[0]
-                                notes_parts = []
-                            else:
-                                notes_parts = parts
-                        else:
-                            notes_parts = []
-                        notes = "".join(notes_parts).strip()
-                        transactions.append(Transaction(date, transaction_type, category, reason, float(amount), notes, mode))
+                        append(Transaction(date, transaction_type, category, reason, float(amount), notes, mode))
+                        continue
                     except ValueError as e:
-                        messagebox.showerror("Error", f"CSV data error at row: {row}. Error: {e}")
-                    except Exception as e:
-                        messagebox.showerror("Error", f"CSV read error at row: {row}. Error: {e}")
+                        errors.append(f"CSV data error at row: {row}. Error: {e}")
+                        continue
+                try:
+                    date, transaction_type, category, reason, amount, *parts = row
+                    notes_parts = []
+                    mode = "Online"
+                    if len(parts) > 1:
+                        mode = parts[-1]
+                        notes_parts = parts[:-1]
+                    elif len(parts) == 1:
+                        if parts[0] in ['Online', 'Cash']:
+                            mode = parts[0]
+                            notes_parts = []
+                        else:
+                            notes_parts = parts
+                    else:
+                        notes_parts = []
+                    notes = "".join(notes_parts).strip()
+                    append(Transaction(date, transaction_type, category, reason, float(amount), notes, mode))
+                except ValueError as e:
+                    errors.append(f"CSV data error at row: {row}. Error: {e}")
+                except Exception as e:
+                    errors.append(f"CSV read error at row: {row}. Error: {e}")
+            _show_load_errors(errors)
     except FileNotFoundError:
         pass
     except Exception as e:
@@ -69,23 +271,33 @@ def load_transactions_from_csv(filename="transactions.csv"):
 
 def export_transactions_to_xlsx(transactions, filename):
     try:
-        workbook = openpyxl.Workbook()
-        sheet = workbook.active
-        sheet.title = "Transaction History"
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("Transaction History")
         headers = ['Date', 'Type', 'Category', 'Reason', 'Amount', 'Notes', 'Mode']
-        sheet.append(headers)
+        widths = [len(h) for h in headers]
+        rows = []
+        for t in transactions:
+            row = (t.date, t.transaction_type, t.category, t.reason, t.amount, t.notes, t.mode)
+            rows.append(row)
+            for i, value in enumerate(row):
+                length = len(str(value))
+                if length > widths[i]:
+                    widths[i] = length
+        for i, width in enumerate(widths):
+            sheet.column_dimensions[get_column_letter(i + 1)].width = width + 2
         header_font = Font(bold=True)
         header_alignment = Alignment(horizontal='center')
         header_border = Border(bottom=Side(style='thin'))
-        for cell in sheet["1:1"]:
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(sheet, value=header)
             cell.font = header_font
             cell.alignment = header_alignment
             cell.border = header_border
-        for transaction in transactions:
-            sheet.append([transaction.date, transaction.transaction_type, transaction.category, transaction.reason, transaction.amount, transaction.notes, transaction.mode])
-        for column_cells in sheet.columns:
-            length = max(len(str(cell.value)) for cell in column_cells)
-            sheet.column_dimensions[column_cells[0].column_letter].width = length + 2
+            header_cells.append(cell)
+        sheet.append(header_cells)
+        for row in rows:
+            sheet.append(row)
         workbook.save(filename)
         messagebox.showinfo("Success", "Transactions exported to XLSX!")
     except Exception as e:
@@ -95,14 +307,29 @@ class FinanceApp(ThemedTk):
     def __init__(self):
         super().__init__(theme="clam")
         self.title("Personal Finance Manager - Advanced")
-        self.transactions = load_transactions_from_csv()
+        self.transactions = load_transactions()
+        self._rebuild_arrays()
+        self._rebuild_tx_index()
+        self._rebuild_facet_indexes()
+        self._init_totals()
         self.current_balance = self.calculate_balance()
+        self._last_summary = [None] * 9
         self.categories = self.load_categories()
         self.filtered_transactions = list(self.transactions)
+        self._dirty = False
+        self._save_after_id = None
+        self._filter_after_id = None
+        self._current_predicate = None
+        self._visible_rows = {}
+        self._txn_version = 0
+        self._filter_cache = OrderedDict()
+        self._category_values = tuple(self.categories)
+        self._filter_category_values = ("All",) + self._category_values
 
         self.init_styles()
         self.init_ui()
         self.update_transaction_tree(self.filtered_transactions)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def init_styles(self):
         style = ttk.Style(self)
@@ -117,15 +344,15 @@ class FinanceApp(ThemedTk):
     def load_categories(self, filename="categories.txt"):
         try:
             with open(filename, 'r') as f:
-                categories = [line.strip() for line in f.readlines()]
-                return sorted(list(set(categories)))
+                categories = sorted(set(line.strip() for line in f))
         except FileNotFoundError:
-            default_categories = ["Food", "Utilities", "Salary", "Entertainment", "Transportation", "Other"]
-            self.save_categories(default_categories)
-            return default_categories
+            categories = ["Food", "Utilities", "Salary", "Entertainment", "Transportation", "Other"]
+            self.save_categories(categories)
         except Exception as e:
             messagebox.showerror("Error", f"Error loading categories: {e}. Using default.")
-            return ["Food", "Utilities", "Salary", "Entertainment", "Transportation", "Other"]
+            categories = ["Food", "Utilities", "Salary", "Entertainment", "Transportation", "Other"]
+        self._category_set = frozenset(categories)
+        return categories
 
     def save_categories(self, categories, filename="categories.txt"):
         try:
@@ -163,7 +390,7 @@ class FinanceApp(ThemedTk):
 
         ttk.Label(input_frame, text="Category:").grid(row=3, column=0, padx=5, pady=5, sticky=tk.W)
         self.category_var = tk.StringVar()
-        self.category_combo = ttk.Combobox(input_frame, textvariable=self.category_var, values=self.categories, width=input_field_width-3)
+        self.category_combo = ttk.Combobox(input_frame, textvariable=self.category_var, values=self._category_values, width=input_field_width-3)
         self.category_combo.grid(row=3, column=1, padx=5, pady=5, sticky=tk.W)
         self.category_combo.set(self.categories[0] if self.categories else "")
 
@@ -250,13 +477,13 @@ class FinanceApp(ThemedTk):
 
         ttk.Label(filter_frame, text="Category:").grid(row=2, column=0, padx=5, pady=2, sticky=tk.W)
         self.filter_category_var = tk.StringVar(value="All")
-        filter_category_options = ["All"] + self.categories
-        filter_category_combo = ttk.Combobox(filter_frame, textvariable=self.filter_category_var, values=filter_category_options, width=12)
-        filter_category_combo.grid(row=2, column=1, padx=5, pady=2, sticky=tk.W)
+        self.filter_category_combo = ttk.Combobox(filter_frame, textvariable=self.filter_category_var, values=self._filter_category_values, width=12)
+        self.filter_category_combo.grid(row=2, column=1, padx=5, pady=2, sticky=tk.W)
 
         ttk.Label(filter_frame, text="Search:").grid(row=3, column=0, padx=5, pady=2, sticky=tk.W)
         self.search_entry = ttk.Entry(filter_frame, width=25)
         self.search_entry.grid(row=3, column=1, columnspan=3, padx=5, pady=2, sticky=tk.W+tk.E)
+        self.search_entry.bind('<KeyRelease>', self._schedule_apply_filters)
 
         filter_button = ttk.Button(filter_frame, text="Apply Filters", command=self.apply_filters)
         filter_button.grid(row=4, column=0, columnspan=2, pady=5)
@@ -316,11 +543,11 @@ class FinanceApp(ThemedTk):
         if not date_str or not amount_str or not reason_str or not category_str:
             messagebox.showerror("Input Error", "Date, Category, Reason, and Amount are required.")
             return False
-        if category_str not in self.categories:
+        if category_str not in self._category_set:
             messagebox.showerror("Input Error", "Invalid Category selected.")
             return False
         try:
-            datetime.datetime.strptime(date_str, '%Y-%m-%d')
+            _parse_iso_date(date_str)
         except ValueError:
             messagebox.showerror("Input Error", "Invalid date format. Use YYYY-MM-DD.")
             return False
@@ -348,7 +575,28 @@ class FinanceApp(ThemedTk):
             amount = float(amount_str)
             new_transaction = Transaction(date, transaction_type, category, reason, amount, notes, mode)
             self.transactions.append(new_transaction)
-            self.save_and_update()
+            self._txn_version += 1
+            self._tx_index[id(new_transaction)] = len(self.transactions) - 1
+            self._append_to_arrays(new_transaction)
+            self._index_transaction(new_transaction)
+            self._apply_contribution(new_transaction, 1)
+            if pa is None and os.path.exists("transactions.csv"):
+                _append_transaction_to_csv(new_transaction)
+            else:
+                self._mark_dirty()
+            self.current_balance = self._tc - self._td
+            self._refresh_summary_labels_from_totals()
+            if self._current_predicate is None:
+                self.apply_filters()
+            else:
+                if self._current_predicate(new_transaction):
+                    t = new_transaction
+                    self.filtered_transactions.append(t)
+                    iid = str(id(t))
+                    self.tree.insert('', tk.END, iid=iid,
+                                     values=(t.date, t.transaction_type, t.category, t.reason, t._amount_str, t.notes, t.mode))
+                    self._visible_rows[iid] = t
+                self.update_summary_labels(self.filtered_transactions)
             self.clear_input_fields()
             self.status_bar.set("Transaction added successfully.")
 
@@ -414,10 +662,15 @@ class FinanceApp(ThemedTk):
                 date = date_str
                 amount = float(amount_str)
                 updated_transaction = Transaction(date, transaction_type, category, reason, amount, notes, mode)
-                original_index = self.transactions.index(old_transaction)
+                original_index = self._tx_index.pop(id(old_transaction))
                 self.transactions[original_index] = updated_transaction
+                self._txn_version += 1
+                self._tx_index[id(updated_transaction)] = original_index
+                self._set_array_row(original_index, updated_transaction)
+                self._rebuild_facet_indexes()
+                self._apply_contribution(old_transaction, -1)
+                self._apply_contribution(updated_transaction, 1)
                 self.save_and_update()
-                self.apply_filters()
                 edit_window.destroy()
                 self.status_bar.set("Transaction edited.")
 
@@ -431,17 +684,31 @@ class FinanceApp(ThemedTk):
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this transaction?"):
             selected_index = self.tree.index(selected_item)
             transaction_to_delete = self.filtered_transactions[selected_index]
-            original_index_to_delete = self.transactions.index(transaction_to_delete)
+            original_index_to_delete = self._tx_index[id(transaction_to_delete)]
             del self.transactions[original_index_to_delete]
-            self.save_and_update()
-            self.apply_filters()
+            self._txn_version += 1
+            self._delete_array_row(original_index_to_delete)
+            self._rebuild_tx_index()
+            self._unindex_transaction(transaction_to_delete)
+            self._apply_contribution(transaction_to_delete, -1)
+            self._mark_dirty()
+            self.current_balance = self._tc - self._td
+            self._refresh_summary_labels_from_totals()
+            self.tree.delete(selected_item[0])
+            self._visible_rows.pop(selected_item[0], None)
+            self.filtered_transactions.remove(transaction_to_delete)
+            self.update_summary_labels(self.filtered_transactions)
             self.status_bar.set("Transaction deleted.")
 
     def clear_all_transactions(self):
         if messagebox.askyesno("Confirm Clear All", "Are you sure you want to delete ALL transactions? This cannot be undone."):
             self.transactions = []
+            self._txn_version += 1
+            self._rebuild_arrays()
+            self._rebuild_tx_index()
+            self._rebuild_facet_indexes()
+            self._init_totals()
             self.save_and_update()
-            self.apply_filters()
             self.status_bar.set("All transactions cleared.")
 
     def export_data(self):
@@ -450,70 +717,212 @@ class FinanceApp(ThemedTk):
             export_transactions_to_xlsx(self.transactions, filename)
             self.status_bar.set(f"Transactions exported to {filename}")
 
+    def _rebuild_arrays(self):
+        transactions = self.transactions
+        self._amounts = np.array([t.amount for t in transactions], dtype=np.float64)
+        self._type_code = np.array([t.type_code for t in transactions], dtype=np.int8)
+        self._mode_code = np.array([t.mode_code for t in transactions], dtype=np.int8)
+        self._cat_codes = np.array([t.category_code for t in transactions], dtype=np.int16)
+        try:
+            # Built from the parsed dates so non-zero-padded entries still get
+            # a real cell; unparseable ones become NaT, which every date
+            # comparison excludes just like the predicate's None check.
+            self._dates = np.array([t._date for t in transactions], dtype='datetime64[D]')
+        except (TypeError, ValueError):
+            self._dates = None
+        self._search_blob = [t._search_blob for t in transactions]
+
+    def _append_to_arrays(self, transaction):
+        n = self._amounts.shape[0] + 1
+        self._amounts = np.resize(self._amounts, n)
+        self._type_code = np.resize(self._type_code, n)
+        self._mode_code = np.resize(self._mode_code, n)
+        self._cat_codes = np.resize(self._cat_codes, n)
+        if self._dates is not None:
+            self._dates = np.resize(self._dates, n)
+        self._search_blob.append('')
+        self._set_array_row(n - 1, transaction)
+
+    def _set_array_row(self, index, transaction):
+        self._amounts[index] = transaction.amount
+        self._type_code[index] = transaction.type_code
+        self._mode_code[index] = transaction.mode_code
+        self._cat_codes[index] = transaction.category_code
+        if self._dates is not None:
+            if transaction._date is not None:
+                self._dates[index] = np.datetime64(transaction._date)
+            else:
+                # Unparseable date: degrade to the no-column state, mirroring
+                # _rebuild_arrays, rather than raising mid-mutation.
+                self._dates = None
+        self._search_blob[index] = transaction._search_blob
+
+    def _delete_array_row(self, index):
+        self._amounts = np.delete(self._amounts, index)
+        self._type_code = np.delete(self._type_code, index)
+        self._mode_code = np.delete(self._mode_code, index)
+        self._cat_codes = np.delete(self._cat_codes, index)
+        if self._dates is not None:
+            self._dates = np.delete(self._dates, index)
+        del self._search_blob[index]
+
+    def _rebuild_tx_index(self):
+        self._tx_index = {id(t): i for i, t in enumerate(self.transactions)}
+
+    def _rebuild_facet_indexes(self):
+        by_type, by_mode, by_category = {}, {}, {}
+        for t in self.transactions:
+            by_type.setdefault(t.transaction_type, []).append(t)
+            by_mode.setdefault(t.mode, []).append(t)
+            by_category.setdefault(t.category, []).append(t)
+        self._by_type, self._by_mode, self._by_category = by_type, by_mode, by_category
+
+    def _index_transaction(self, transaction):
+        self._by_type.setdefault(transaction.transaction_type, []).append(transaction)
+        self._by_mode.setdefault(transaction.mode, []).append(transaction)
+        self._by_category.setdefault(transaction.category, []).append(transaction)
+
+    def _unindex_transaction(self, transaction):
+        self._by_type[transaction.transaction_type].remove(transaction)
+        self._by_mode[transaction.mode].remove(transaction)
+        self._by_category[transaction.category].remove(transaction)
+
+    def _init_totals(self):
+        self._tc, self._td, self._oc, self._od, self._cc, self._cd = self.calculate_summary()
+
+    def _apply_contribution(self, transaction, sign):
+        amount = transaction.amount * sign
+        if transaction.transaction_type == "Credit":
+            self._tc += amount
+            if transaction.mode == "Online":
+                self._oc += amount
+            else:
+                self._cc += amount
+        else:
+            self._td += amount
+            if transaction.mode == "Online":
+                self._od += amount
+            else:
+                self._cd += amount
+
+    def _compute_all(self, transactions):
+        if transactions is None or transactions is self.transactions:
+            total_credits, total_debits, online_credits, online_debits, cash_credits, cash_debits = self.calculate_summary()
+        else:
+            total_credits, total_debits = 0, 0
+            online_credits, online_debits = 0, 0
+            cash_credits, cash_debits = 0, 0
+            for transaction in transactions:
+                signed = transaction._signed
+                if signed >= 0:
+                    total_credits += signed
+                    if transaction._mode_is_online:
+                        online_credits += signed
+                    else:
+                        cash_credits += signed
+                else:
+                    total_debits -= signed
+                    if transaction._mode_is_online:
+                        online_debits -= signed
+                    else:
+                        cash_debits -= signed
+        return (total_credits - total_debits, online_credits - online_debits, cash_credits - cash_debits,
+                total_credits, total_debits, online_credits, online_debits, cash_credits, cash_debits)
+
     def calculate_balance(self, transactions=None, mode=None):
-        if transactions is None:
-            transactions = self.transactions
+        if transactions is None or transactions is self.transactions:
+            signed = self._amounts * self._type_code
+            if mode:
+                signed = signed[self._mode_code == (0 if mode == "Online" else 1)]
+            return float(signed.sum())
         if mode:
-            transactions = [t for t in transactions if t.mode == mode]
-        balance = 0
-        for transaction in transactions:
-            if transaction.transaction_type == "Credit":
-                balance += transaction.amount
-            else:
-                balance -= transaction.amount
-        return balance
+            mode_is_online = mode == "Online"
+            return sum(t._signed for t in transactions if t._mode_is_online == mode_is_online)
+        return sum(t._signed for t in transactions)
 
     def calculate_summary(self, transactions=None):
-        if transactions is None:
-            transactions = self.transactions
-        total_credits, total_debits = 0, 0
-        online_credits, online_debits = 0, 0
-        cash_credits, cash_debits = 0, 0
-
-        for transaction in transactions:
-            if transaction.transaction_type == "Credit":
-                total_credits += transaction.amount
-                if transaction.mode == "Online":
-                    online_credits += transaction.amount
-                else:
-                    cash_credits += transaction.amount
-            else:
-                total_debits += transaction.amount
-                if transaction.mode == "Online":
-                    online_debits += transaction.amount
-                else:
-                    cash_debits += transaction.amount
-        return total_credits, total_debits, online_credits, online_debits, cash_credits, cash_debits
+        if transactions is None or transactions is self.transactions:
+            if njit is not None:
+                return _summary_kernel(self._amounts, self._type_code, self._mode_code)
+            amounts = self._amounts
+            credits = self._type_code == 1
+            online = self._mode_code == 0
+            online_credits = float(amounts[credits & online].sum())
+            online_debits = float(amounts[~credits & online].sum())
+            cash_credits = float(amounts[credits & ~online].sum())
+            cash_debits = float(amounts[~credits & ~online].sum())
+            return (online_credits + cash_credits, online_debits + cash_debits,
+                    online_credits, online_debits, cash_credits, cash_debits)
+        return self._compute_all(transactions)[3:]
 
     def update_summary_labels(self, transactions=None):
         if transactions is None:
             transactions = self.transactions
-        total_credits, total_debits, online_credits, online_debits, cash_credits, cash_debits = self.calculate_summary(transactions)
-        current_balance = self.calculate_balance(transactions=transactions)
-        online_balance = self.calculate_balance(transactions=transactions, mode="Online")
-        cash_balance = self.calculate_balance(transactions=transactions, mode="Cash")
-
-        self.balance_label.config(text=f"₹{current_balance:.2f}")
-        self.online_balance_label.config(text=f"₹{online_balance:.2f}")
-        self.cash_balance_label.config(text=f"₹{cash_balance:.2f}")
-        self.total_credits_label.config(text=f"₹{total_credits:.2f}")
-        self.total_debits_label.config(text=f"₹{total_debits:.2f}")
-        self.online_credits_label.config(text=f"₹{online_credits:.2f}")
-        self.online_debits_label.config(text=f"₹{online_debits:.2f}")
-        self.cash_credits_label.config(text=f"₹{cash_credits:.2f}")
-        self.cash_debits_label.config(text=f"₹{cash_debits:.2f}")
+        self._set_summary_labels(self._compute_all(transactions))
+
+    def _refresh_summary_labels_from_totals(self):
+        self._set_summary_labels((self._tc - self._td, self._oc - self._od, self._cc - self._cd,
+                                  self._tc, self._td, self._oc, self._od, self._cc, self._cd))
+
+    def _set_summary_labels(self, values):
+        labels = (self.balance_label, self.online_balance_label, self.cash_balance_label,
+                  self.total_credits_label, self.total_debits_label,
+                  self.online_credits_label, self.online_debits_label,
+                  self.cash_credits_label, self.cash_debits_label)
+        last = self._last_summary
+        for i, (label, value) in enumerate(zip(labels, values)):
+            if value != last[i]:
+                label.config(text=f"₹{value:.2f}")
+                last[i] = value
+
+    def _mark_dirty(self):
+        self._dirty = True
+        if self._save_after_id is None:
+            self._save_after_id = self.after(500, self._flush_if_dirty)
+
+    def _flush_if_dirty(self):
+        self._save_after_id = None
+        if self._dirty:
+            self._dirty = False
+            save_transactions(self.transactions)
+
+    def _on_close(self):
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if self._dirty:
+            self._dirty = False
+            save_transactions(self.transactions)
+        self.destroy()
 
     def save_and_update(self):
-        save_transactions_to_csv(self.transactions)
-        self.current_balance = self.calculate_balance()
-        self.update_summary_labels()
+        self._mark_dirty()
+        self._refresh_after_mutation()
+
+    def _refresh_after_mutation(self):
+        self.current_balance = self._tc - self._td
+        self._refresh_summary_labels_from_totals()
         self.apply_filters()
 
     def update_transaction_tree(self, transactions_to_display):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for transaction in transactions_to_display:
-            self.tree.insert('', tk.END, values=(transaction.date, transaction.transaction_type, transaction.category, transaction.reason, f"₹{transaction.amount:.2f}", transaction.notes, transaction.mode))
+        # Diff against the currently displayed rows: delete the rows that left
+        # and insert the ones that entered at their positions. Survivors keep
+        # master-list order in both the old and new views, so they never move.
+        # _visible_rows holds a reference per displayed row, which also keeps
+        # the id()-based iids unique among live rows.
+        tree = self.tree
+        old_rows = self._visible_rows
+        pairs = [(str(id(t)), t) for t in transactions_to_display]
+        new_rows = dict(pairs)
+        leaving = [iid for iid in old_rows if iid not in new_rows]
+        if leaving:
+            tree.delete(*leaving)
+        insert = tree.insert
+        for i, (iid, t) in enumerate(pairs):
+            if iid not in old_rows:
+                insert('', i, iid=iid,
+                       values=(t.date, t.transaction_type, t.category, t.reason, t._amount_str, t.notes, t.mode))
+        self._visible_rows = new_rows
 
     def clear_input_fields(self):
         self.date_entry.delete(0, tk.END)
@@ -524,7 +933,18 @@ class FinanceApp(ThemedTk):
         self.notes_entry.delete("1.0", tk.END)
         self.mode_var.set("Online")
 
-    def apply_filters(self):
+    def _schedule_apply_filters(self, event=None):
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(150, self._debounced_apply_filters)
+
+    def _debounced_apply_filters(self):
+        self._filter_after_id = None
+        # quiet: a half-typed or cleared date field must not pop a modal on
+        # every debounce fire; the explicit Apply Filters button still warns.
+        self.apply_filters(quiet=True)
+
+    def apply_filters(self, quiet=False):
         start_date_str = self.filter_start_date_entry.get()
         end_date_str = self.filter_end_date_entry.get()
         filter_type = self.filter_type_var.get()
@@ -532,24 +952,127 @@ class FinanceApp(ThemedTk):
         search_term = self.search_entry.get().lower()
         filter_mode = self.filter_mode_var.get()
 
-        filtered = self.transactions[:]
-
+        transactions = self.transactions
+        n = len(transactions)
+        start_date = end_date = None
         try:
-            start_date = datetime.datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            end_date = datetime.datetime.strptime(end_date_str, '%Y-%m-%d').date()
-            filtered = [t for t in filtered if start_date <= datetime.datetime.strptime(t.date, '%Y-%m-%d').date() <= end_date]
+            start_date = _parse_iso_date(start_date_str)
+            end_date = _parse_iso_date(end_date_str)
         except ValueError:
-            messagebox.showwarning("Filter Warning", "Invalid date format. Dates ignored.")
+            if not quiet:
+                messagebox.showwarning("Filter Warning", "Invalid date format. Dates ignored.")
+            start_date = end_date = None
+        dates_valid = start_date is not None
+
+        want_type = None if filter_type == "All" else (1 if filter_type == "Credit" else -1)
+        want_mode = None if filter_mode == "All" else (0 if filter_mode == "Online" else 1)
+        want_category = None if filter_category == "All" else _category_codes.get(filter_category, -1)
+
+        def predicate(t, _tcode=want_type, _mcode=want_mode, _ccode=want_category,
+                      _term=search_term, _valid=dates_valid, _start=start_date, _end=end_date):
+            return ((_tcode is None or t.type_code == _tcode)
+                    and (_mcode is None or t.mode_code == _mcode)
+                    and (_ccode is None or t.category_code == _ccode)
+                    and (not _valid or (t._date is not None and _start <= t._date <= _end))
+                    and (not _term or _term in t._search_blob))
+        self._current_predicate = predicate
+
+        # Repeated filter states (toggling between two views, re-running the
+        # same search) are served from a small cache. _txn_version is part of
+        # the key, so any mutation naturally invalidates every cached result.
+        cache = self._filter_cache
+        cache_key = (self._txn_version, start_date_str, end_date_str,
+                     filter_type, filter_mode, filter_category, search_term)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            cache.move_to_end(cache_key)
+            self.filtered_transactions = cached
+            self.update_transaction_tree(cached)
+            self.update_summary_labels(cached)
+            self.status_bar.set(f"Showing {len(cached)} transactions.")
+            return
 
+        posting_lists = []
         if filter_type != "All":
-            filtered = [t for t in filtered if t.transaction_type == filter_type]
+            posting_lists.append(self._by_type.get(filter_type, []))
         if filter_mode != "All":
-            filtered = [t for t in filtered if t.mode == filter_mode]
+            posting_lists.append(self._by_mode.get(filter_mode, []))
         if filter_category != "All":
-            filtered = [t for t in filtered if t.category == filter_category]
-        if search_term:
-            filtered = [t for t in filtered if search_term in t.reason.lower() or search_term in t.category.lower() or search_term in t.notes.lower()]
+            posting_lists.append(self._by_category.get(filter_category, []))
+
+        if posting_lists and len(min(posting_lists, key=len)) * 4 <= n:
+            # A pinned facet matches few rows: scan its posting list instead of
+            # building full-length masks.
+            base = min(posting_lists, key=len)
+            filtered = list(filter(predicate, base))
+            cache[cache_key] = filtered
+            if len(cache) > 8:
+                cache.popitem(last=False)
+            self.filtered_transactions = filtered
+            self.update_transaction_tree(self.filtered_transactions)
+            self.update_summary_labels(self.filtered_transactions)
+            self.status_bar.set(f"Showing {len(self.filtered_transactions)} transactions.")
+            return
+
+        dates_aligned = self._dates is not None and self._dates.shape[0] == n
+        date_fallback = dates_valid and not dates_aligned
+        arrays_aligned = self._type_code.shape[0] == n and self._mode_code.shape[0] == n and self._cat_codes.shape[0] == n
+        need_type = want_type is not None
+        need_mode = want_mode is not None
+        need_category = want_category is not None
+
+        if njit is not None and arrays_aligned:
+            use_dates = dates_valid and dates_aligned
+            if use_dates:
+                dates_i8 = self._dates.view(np.int64)
+                d_lo = np.datetime64(start_date).astype(np.int64)
+                d_hi = np.datetime64(end_date).astype(np.int64)
+            else:
+                dates_i8, d_lo, d_hi = _EMPTY_I8, 0, 0
+            mask = _filter_kernel(dates_i8, use_dates, d_lo, d_hi,
+                                  self._type_code, want_type if need_type else 0,
+                                  self._mode_code, want_mode if need_mode else -1,
+                                  self._cat_codes, want_category if need_category else -2)
+            need_type = need_mode = need_category = False
+        else:
+            mask = np.ones(n, dtype=bool)
+            if dates_valid and dates_aligned:
+                mask &= (self._dates >= np.datetime64(start_date)) & (self._dates <= np.datetime64(end_date))
+            if need_type and self._type_code.shape[0] == n:
+                mask &= self._type_code == want_type
+                need_type = False
+            if need_mode and self._mode_code.shape[0] == n:
+                mask &= self._mode_code == want_mode
+                need_mode = False
+            if need_category and self._cat_codes.shape[0] == n:
+                mask &= self._cat_codes == want_category
+                need_category = False
+
+        search_done = False
+        blobs = self._search_blob
+        if search_term and len(blobs) == n:
+            mask &= np.fromiter((search_term in s for s in blobs), dtype=bool, count=n)
+            search_done = True
+        need_search = bool(search_term) and not search_done
+
+        def scan(with_date):
+            return [t for t, keep in zip(transactions, mask) if keep
+                    and (not need_type or t.type_code == want_type)
+                    and (not need_mode or t.mode_code == want_mode)
+                    and (not need_category or t.category_code == want_category)
+                    and (not with_date or start_date <= (t._date if t._date is not None else _parse_iso_date(t.date)) <= end_date)
+                    and (not need_search or search_term in t._search_blob)]
 
+        try:
+            filtered = scan(date_fallback)
+        except ValueError:
+            if not quiet:
+                messagebox.showwarning("Filter Warning", "Invalid date format. Dates ignored.")
+            filtered = scan(False)
+
+        cache[cache_key] = filtered
+        if len(cache) > 8:
+            cache.popitem(last=False)
         self.filtered_transactions = filtered
         self.update_transaction_tree(self.filtered_transactions)
         self.update_summary_labels(self.filtered_transactions)
@@ -580,8 +1103,8 @@ class FinanceApp(ThemedTk):
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.category_listbox.config(yscrollcommand=scrollbar.set)
 
-        for category in self.categories:
-            self.category_listbox.insert(tk.END, category)
+        if self.categories:
+            self.category_listbox.insert(tk.END, *self.categories)
 
         input_frame = ttk.Frame(category_window)
         input_frame.pack(padx=10, pady=5, fill=tk.X)
@@ -593,14 +1116,23 @@ class FinanceApp(ThemedTk):
         delete_category_button = ttk.Button(input_frame, text="Delete Category", command=self.delete_category)
         delete_category_button.pack(side=tk.LEFT, padx=5)
 
+    def _refresh_category_values(self):
+        # Called only from the add/delete paths, which have already verified
+        # that the category list actually changed; reads between mutations
+        # reuse the cached tuples.
+        values = tuple(self.categories)
+        self._category_values = values
+        self._filter_category_values = ("All",) + values
+        self.category_combo['values'] = values
+        self.filter_category_combo['values'] = self._filter_category_values
+
     def add_category(self):
         new_category = self.new_category_entry.get().strip()
-        if new_category and new_category not in self.categories:
-            self.categories.append(new_category)
-            self.categories.sort()
+        if new_category and new_category not in self._category_set:
+            bisect.insort(self.categories, new_category)
+            self._category_set = frozenset(self.categories)
             self.save_categories(self.categories)
-            self.category_combo['values'] = self.categories
-            self.filter_category_combo['values'] = ["All"] + self.categories
+            self._refresh_category_values()
             self.category_listbox.insert(tk.END, new_category)
             self.new_category_entry.delete(0, tk.END)
         elif not new_category:
@@ -613,15 +1145,18 @@ class FinanceApp(ThemedTk):
         if selected_index:
             category_to_delete = self.category_listbox.get(selected_index[0])
             if messagebox.askyesno("Confirm Delete", f"Delete category '{category_to_delete}'?"):
-                if category_to_delete in self.categories:
+                if category_to_delete in self._category_set:
                     self.categories.remove(category_to_delete)
+                    self._category_set = frozenset(self.categories)
                     self.save_categories(self.categories)
-                    self.category_combo['values'] = self.categories
-                    self.filter_category_combo['values'] = ["All"] + self.categories
+                    self._refresh_category_values()
                     self.category_listbox.delete(selected_index[0])
-                    self.filter_category_var.set("All")
+                    filter_was_active = self.filter_category_var.get() == category_to_delete
+                    if filter_was_active:
+                        self.filter_category_var.set("All")
                     self.category_var.set(self.categories[0] if self.categories else "")
-                    self.apply_filters()
+                    if filter_was_active or any(t.category == category_to_delete for t in self.filtered_transactions):
+                        self.apply_filters()
 
 if __name__ == "__main__":
     app = FinanceApp()